@@ -1,14 +1,23 @@
 # main.py - Complete FastAPI Backend with Anti-DevTools Protection
-from fastapi import FastAPI, HTTPException, Cookie, Response
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi import FastAPI, HTTPException, Cookie, Request, Response
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel
 from typing import Optional
+import asyncio
+import functools
+import gzip
+import hashlib
 import psycopg2
 import sqlite3
 import os
 import json
 import secrets
+import struct
+import threading
+import time
+from collections import Counter
 from datetime import datetime, timedelta
 
 app = FastAPI()
@@ -22,6 +31,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Default configuration
 DEFAULT_CONFIG = {
     "triggerbot": {
@@ -58,28 +69,146 @@ DEFAULT_CONFIG = {
     }
 }
 
+# Serialized once at import so hot paths never re-dump the default config
+_DEFAULT_CFG_JSON = json.dumps(DEFAULT_CONFIG, separators=(",", ":"))
+
+def _now_iso():
+    """Timestamp for TEXT columns. Stays Python-side: a server-side NOW()
+    default would stamp Postgres/SQLite in their own formats and break the
+    lexicographic ordering the ISO columns rely on."""
+    return datetime.now().isoformat()
+
 # Database config
 DATABASE_URL = os.getenv("DATABASE_URL")
 USE_POSTGRES = DATABASE_URL is not None
 
+if USE_POSTGRES:
+    from psycopg2 import pool as pg_pool
+    _PG_POOL = pg_pool.ThreadedConnectionPool(
+        minconn=int(os.getenv("DB_POOL_MIN", "5")),
+        maxconn=int(os.getenv("DB_POOL_MAX", "30")),
+        dsn=DATABASE_URL,
+    )
+    # getconn() raises PoolError the moment the pool is empty rather than
+    # queueing, so gate checkouts on a semaphore sized to the pool: callers
+    # beyond maxconn (threadpool handlers and asyncio.to_thread alike) wait
+    # for a free connection instead of 500ing.
+    _pg_pool_slots = threading.BoundedSemaphore(int(os.getenv("DB_POOL_MAX", "30")))
+else:
+    _PG_POOL = None
+
+_local = threading.local()
+
+class PooledConnection:
+    """Wraps a pooled connection so the existing db.close() call sites
+    return it to the pool instead of tearing down the session."""
+
+    def __init__(self, conn, release):
+        self._conn = conn
+        self._release = release
+
+    def close(self):
+        try:
+            self._conn.rollback()
+        except Exception:
+            pass
+        self._release(self._conn)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+# Statements prepared once per pooled Postgres connection so the server
+# skips parse+plan on the hottest query. Tracked by id(), which can alias
+# when the pool replaces a dead connection with a fresh object at a reused
+# address — _read_config re-prepares on EXECUTE failure to cover that.
+# SQLite needs no equivalent — sqlite3 caches compiled statements per
+# connection already.
+_HOT_PREPARES = (
+    "PREPARE read_config (text) AS SELECT config FROM settings WHERE key = $1",
+)
+_prepared_conn_ids = set()
+
+def _release_pg_conn(conn):
+    _PG_POOL.putconn(conn)
+    _pg_pool_slots.release()
+
 def get_db():
     if USE_POSTGRES:
-        return psycopg2.connect(DATABASE_URL)
-    else:
-        return sqlite3.connect("local.db")
+        _pg_pool_slots.acquire()
+        try:
+            conn = _PG_POOL.getconn()
+        except Exception:
+            _pg_pool_slots.release()
+            raise
+        if id(conn) not in _prepared_conn_ids:
+            cur = conn.cursor()
+            # The slider save path is latency-critical; durable-sync is
+            # overkill for this data, so every pooled connection commits
+            # asynchronously (per-connection, like the SQLite pragmas below).
+            # Committed on its own so a failed PREPARE can't roll it back.
+            cur.execute("SET synchronous_commit TO off")
+            conn.commit()
+            try:
+                for stmt in _HOT_PREPARES:
+                    cur.execute(stmt)
+                conn.commit()
+                _prepared_conn_ids.add(id(conn))
+            except Exception:
+                # PREPARE parse-analyzes settings, which doesn't exist on a
+                # fresh database until init_db — itself a get_db caller —
+                # has created the schema. Hand the connection out unprepared
+                # and retry on a later checkout; _read_config falls back to
+                # the plain SELECT per call in the meantime.
+                conn.rollback()
+            cur.close()
+        return PooledConnection(conn, _release_pg_conn)
+
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect("local.db", check_same_thread=False)
+        # WAL persists in the db file, but the tuning pragmas are
+        # per-connection and must be reapplied for each thread
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA busy_timeout=5000")
+        _local.conn = conn
+    return PooledConnection(conn, lambda c: None)
+
+# Dialect split for the prepared hot path: EXECUTE on Postgres, plain
+# parameterized text on SQLite
+READ_CONFIG_SQL = "EXECUTE read_config (%s)" if USE_POSTGRES else "SELECT config FROM settings WHERE key = ?"
+
+def dict_cursor(db):
+    """Cursor whose rows arrive as dicts keyed by column name, so list
+    endpoints can return fetchall() without per-row assembly"""
+    if USE_POSTGRES:
+        from psycopg2.extras import RealDictCursor
+        return db.cursor(cursor_factory=RealDictCursor)
+    cur = db.cursor()
+    cur.row_factory = lambda c, row: {d[0]: v for d, v in zip(c.description, row)}
+    return cur
 
+@functools.lru_cache(maxsize=None)
 def q(query):
-    """Convert PostgreSQL placeholders to SQLite if needed"""
+    """Convert PostgreSQL placeholders to SQLite if needed.
+
+    Memoized: every call site passes a literal, so each query string is
+    rewritten at most once per process instead of on every request."""
     if USE_POSTGRES:
         return query
     return query.replace("%s", "?")
 
-def init_db():
-    db = get_db()
-    cur = db.cursor()
-    
-    if USE_POSTGRES:
-        cur.execute("""CREATE TABLE IF NOT EXISTS keys (
+# Bump when the schema changes; init_db only runs migrations for older DBs
+SCHEMA_VERSION = 3
+
+def _schema_statements():
+    """Dialect-neutral DDL; only the autoincrement spelling differs"""
+    serial = "SERIAL PRIMARY KEY" if USE_POSTGRES else "INTEGER PRIMARY KEY AUTOINCREMENT"
+    return [
+        """CREATE TABLE IF NOT EXISTS keys (
             key TEXT PRIMARY KEY,
             duration TEXT NOT NULL,
             created_at TEXT NOT NULL,
@@ -90,25 +219,17 @@ def init_db():
             hwid_resets INTEGER DEFAULT 0,
             active INTEGER DEFAULT 0,
             created_by TEXT
-        )""")
-        
-        try:
-            cur.execute("ALTER TABLE keys ADD COLUMN IF NOT EXISTS hwid_resets INTEGER DEFAULT 0")
-            db.commit()
-        except:
-            pass
-        
-        cur.execute("""CREATE TABLE IF NOT EXISTS saved_configs (
-            id SERIAL PRIMARY KEY,
+        )""",
+        f"""CREATE TABLE IF NOT EXISTS saved_configs (
+            id {serial},
             license_key TEXT NOT NULL,
             config_name TEXT NOT NULL,
             config_data TEXT NOT NULL,
             created_at TEXT NOT NULL,
             UNIQUE(license_key, config_name)
-        )""")
-        
-        cur.execute("""CREATE TABLE IF NOT EXISTS public_configs (
-            id SERIAL PRIMARY KEY,
+        )""",
+        f"""CREATE TABLE IF NOT EXISTS public_configs (
+            id {serial},
             config_name TEXT NOT NULL,
             author_name TEXT NOT NULL,
             game_name TEXT NOT NULL,
@@ -117,111 +238,83 @@ def init_db():
             license_key TEXT NOT NULL,
             created_at TEXT NOT NULL,
             downloads INTEGER DEFAULT 0
-        )""")
-        
-        try:
-            cur.execute("SELECT discord_id FROM public_configs LIMIT 1")
-            cur.execute("DROP TABLE IF EXISTS public_configs")
-            cur.execute("""CREATE TABLE public_configs (
-                id SERIAL PRIMARY KEY,
-                config_name TEXT NOT NULL,
-                author_name TEXT NOT NULL,
-                game_name TEXT NOT NULL,
-                description TEXT,
-                config_data TEXT NOT NULL,
-                license_key TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                downloads INTEGER DEFAULT 0
-            )""")
-            db.commit()
-        except Exception as e:
-            db.rollback()
-            
-        cur.execute("""CREATE TABLE IF NOT EXISTS user_sessions (
+        )""",
+        """CREATE TABLE IF NOT EXISTS user_sessions (
             session_id TEXT PRIMARY KEY,
             license_key TEXT NOT NULL,
             created_at TEXT NOT NULL,
             expires_at TEXT NOT NULL
-        )""")
-        
-        cur.execute("""CREATE TABLE IF NOT EXISTS settings (
+        )""",
+        """CREATE TABLE IF NOT EXISTS settings (
             key TEXT PRIMARY KEY,
             config TEXT NOT NULL
-        )""")
+        )""",
+        # Hot lookup paths; key PKs and the saved_configs UNIQUE already
+        # carry their own indexes
+        "CREATE INDEX IF NOT EXISTS ix_keys_redeemed_by ON keys(redeemed_by)",
+        "CREATE INDEX IF NOT EXISTS ix_saved_configs_list ON saved_configs(license_key, created_at DESC)",
+        "CREATE INDEX IF NOT EXISTS ix_public_configs_created ON public_configs(created_at DESC)",
+    ]
+
+def init_db():
+    # Multi-worker deployments can set RUN_INIT_DB=0 on all but one worker
+    # so only a single process pays the schema-check roundtrips at boot
+    if os.environ.get("RUN_INIT_DB") == "0":
+        return
+
+    db = get_db()
+    cur = db.cursor()
+
+    cur.execute("CREATE TABLE IF NOT EXISTS schema_meta (version INTEGER NOT NULL)")
+    db.commit()
+    cur.execute("SELECT version FROM schema_meta")
+    row = cur.fetchone()
+    version = row[0] if row else 0
+
+    if version >= SCHEMA_VERSION:
+        db.close()
+        return
+
+    statements = _schema_statements()
+    # One batched round trip: sqlite3 parses the script in a single call,
+    # and psycopg2 accepts ;-separated DDL in one execute
+    if USE_POSTGRES:
+        cur.execute(";\n".join(statements))
     else:
-        cur.execute("""CREATE TABLE IF NOT EXISTS keys (
-            key TEXT PRIMARY KEY,
-            duration TEXT NOT NULL,
-            created_at TEXT NOT NULL,
-            expires_at TEXT,
-            redeemed_at TEXT,
-            redeemed_by TEXT,
-            hwid TEXT,
-            hwid_resets INTEGER DEFAULT 0,
-            active INTEGER DEFAULT 0,
-            created_by TEXT
-        )""")
-        
+        cur.executescript(";\n".join(statements))
+    db.commit()
+
+    if version < 2:
+        # Legacy upgrade: keys.hwid_resets was added after launch
         try:
-            cur.execute("ALTER TABLE keys ADD COLUMN hwid_resets INTEGER DEFAULT 0")
+            if USE_POSTGRES:
+                cur.execute("ALTER TABLE keys ADD COLUMN IF NOT EXISTS hwid_resets INTEGER DEFAULT 0")
+            else:
+                cur.execute("ALTER TABLE keys ADD COLUMN hwid_resets INTEGER DEFAULT 0")
             db.commit()
-        except:
-            pass
-        
-        cur.execute("""CREATE TABLE IF NOT EXISTS saved_configs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            license_key TEXT NOT NULL,
-            config_name TEXT NOT NULL,
-            config_data TEXT NOT NULL,
-            created_at TEXT NOT NULL,
-            UNIQUE(license_key, config_name)
-        )""")
-        
-        cur.execute("""CREATE TABLE IF NOT EXISTS public_configs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            config_name TEXT NOT NULL,
-            author_name TEXT NOT NULL,
-            game_name TEXT NOT NULL,
-            description TEXT,
-            config_data TEXT NOT NULL,
-            license_key TEXT NOT NULL,
-            created_at TEXT NOT NULL,
-            downloads INTEGER DEFAULT 0
-        )""")
-        
+        except Exception:
+            db.rollback()
+
+        # Legacy upgrade: public_configs used to key authors by discord_id.
+        # Only rebuild when the legacy column is actually present — never on
+        # a current-schema table.
         try:
             cur.execute("SELECT discord_id FROM public_configs LIMIT 1")
-            cur.execute("DROP TABLE IF EXISTS public_configs")
-            cur.execute("""CREATE TABLE public_configs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                config_name TEXT NOT NULL,
-                author_name TEXT NOT NULL,
-                game_name TEXT NOT NULL,
-                description TEXT,
-                config_data TEXT NOT NULL,
-                license_key TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                downloads INTEGER DEFAULT 0
-            )""")
+            has_legacy_schema = True
+        except Exception:
+            db.rollback()
+            has_legacy_schema = False
+
+        if has_legacy_schema:
+            cur.execute("DROP TABLE public_configs")
+            cur.execute(statements[2])
             db.commit()
-        except Exception as e:
-            try:
-                db.rollback()
-            except:
-                pass
-                
-        cur.execute("""CREATE TABLE IF NOT EXISTS user_sessions (
-            session_id TEXT PRIMARY KEY,
-            license_key TEXT NOT NULL,
-            created_at TEXT NOT NULL,
-            expires_at TEXT NOT NULL
-        )""")
-        
-        cur.execute("""CREATE TABLE IF NOT EXISTS settings (
-            key TEXT PRIMARY KEY,
-            config TEXT NOT NULL
-        )""")
-    
+
+    if row:
+        cur.execute(q("UPDATE schema_meta SET version=%s"), (SCHEMA_VERSION,))
+    else:
+        cur.execute(q("INSERT INTO schema_meta (version) VALUES (%s)"), (SCHEMA_VERSION,))
+
     db.commit()
     db.close()
     print("✅ Database initialized")
@@ -260,79 +353,157 @@ class SavedConfigRequest(BaseModel):
 
 # === VALIDATION ===
 
+# Heartbeat validations repeat the same (key, hwid) constantly; cache hits
+# skip the DB. Failures get a short TTL so a racing bind never locks a
+# client out for long.
+_VALIDATE_TTL_OK = 30.0
+_VALIDATE_TTL_FAIL = 2.0
+_validate_cache = {}
+
+# Every TTL cache in this file is keyed by caller-chosen input (license
+# keys, hwids, page numbers) on unauthenticated routes, so inserts go
+# through this cap: expired entries are swept first, then the oldest,
+# keeping memory bounded under probing traffic.
+_CACHE_MAX_ENTRIES = 1024
+
+def _cache_put(cache, key, value):
+    if len(cache) >= _CACHE_MAX_ENTRIES:
+        now = time.monotonic()
+        for k in [k for k, v in list(cache.items()) if v[0] <= now]:
+            cache.pop(k, None)
+        while len(cache) >= _CACHE_MAX_ENTRIES:
+            cache.pop(next(iter(cache)), None)
+    cache[key] = value
+
+def _invalidate_validate_cache(key):
+    """Drop cached validations and dashboard data for a key after its row
+    changes"""
+    # Snapshot first: validate handlers insert from other threads, and
+    # iterating the live dict could raise mid-invalidation
+    for cache_key in [ck for ck in list(_validate_cache) if ck[0] == key]:
+        _validate_cache.pop(cache_key, None)
+    _dash_cache.pop(key, None)
+
 @app.post("/api/validate")
 def validate_user(data: KeyValidate):
     """Validate license key"""
+    cached = _validate_cache.get((data.key, data.hwid))
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
+    result = _validate_user_uncached(data)
+    ttl = _VALIDATE_TTL_OK if result.get("valid") else _VALIDATE_TTL_FAIL
+    _cache_put(_validate_cache, (data.key, data.hwid), (time.monotonic() + ttl, result))
+    return result
+
+def _validate_user_uncached(data):
     db = get_db()
     cur = db.cursor()
-    
+
+    now = _now_iso()
+
+    if data.hwid != 'web-login':
+        # Single round-trip for the happy path: validate, bind on first
+        # login (COALESCE makes re-binds a no-op) and return the stored
+        # hwid in one statement.
+        cur.execute(q(
+            "UPDATE keys SET hwid=COALESCE(hwid, %s) "
+            "WHERE key=%s AND active=1 AND (hwid IS NULL OR hwid=%s) "
+            "AND (expires_at IS NULL OR expires_at > %s) RETURNING hwid"
+        ), (data.hwid, data.key, data.hwid, now))
+        bound = cur.fetchone()
+        if bound:
+            db.commit()
+            db.close()
+            return {"valid": True, "message": "Authentication successful"}
+
+    # Miss (or web login): classify with a plain SELECT
     cur.execute(q("SELECT key, active, expires_at, hwid FROM keys WHERE key=%s"), (data.key,))
     result = cur.fetchone()
-    
+    db.close()
+
     if not result:
-        db.close()
         return {"valid": False, "error": "Invalid license key"}
-    
+
     key, active, expires_at, hwid = result
-    
+
     if active == 0:
-        db.close()
         return {"valid": False, "error": "License inactive"}
-    
-    if expires_at and datetime.now() > datetime.fromisoformat(expires_at):
-        db.close()
+
+    if expires_at and expires_at <= now:
         return {"valid": False, "error": "License expired"}
-    
+
     if data.hwid != 'web-login':
-        if hwid is None:
-            cur.execute(q("UPDATE keys SET hwid=%s WHERE key=%s"), (data.hwid, data.key))
-            db.commit()
-            db.close()
-            return {"valid": True, "message": "HWID bound successfully"}
-        elif hwid == data.hwid:
-            db.close()
-            return {"valid": True, "message": "Authentication successful"}
-        else:
-            db.close()
-            return {"valid": False, "error": "HWID mismatch"}
-    
-    db.close()
+        return {"valid": False, "error": "HWID mismatch"}
+
     return {"valid": True, "message": "Authentication successful"}
 
 # === CONFIG SYNC ENDPOINTS (FIXED) ===
 
-@app.get("/api/config/{key}")
-def get_config(key: str):
-    """Get config for a license key"""
+# Coalesce concurrent reads per key; bursts of identical GETs issue one query
+_CONFIG_READ_TTL = 1.0
+_config_read_cache = {}
+_config_inflight = {}
+
+def _read_config(key):
+    """Return the stored config as raw JSON text; the column already holds
+    serialized JSON so reads never round-trip through json.loads/dumps."""
     db = get_db()
     cur = db.cursor()
-    
+
     try:
-        cur.execute(q("SELECT config FROM settings WHERE key=%s"), (key,))
+        try:
+            cur.execute(READ_CONFIG_SQL, (key,))
+        except Exception:
+            if not USE_POSTGRES:
+                raise
+            # The pool replaces dead connections, and the replacement can
+            # land at a reused id() and skip get_db's PREPARE. Re-prepare
+            # for future calls and serve this one with the plain statement
+            # instead of silently answering with defaults.
+            db.rollback()
+            try:
+                for stmt in _HOT_PREPARES:
+                    cur.execute(stmt)
+                db.commit()
+            except Exception:
+                db.rollback()
+            cur.execute("SELECT config FROM settings WHERE key = %s", (key,))
         result = cur.fetchone()
-        
-        if not result:
-            if USE_POSTGRES:
-                cur.execute(
-                    "INSERT INTO settings (key, config) VALUES (%s, %s) ON CONFLICT (key) DO NOTHING",
-                    (key, json.dumps(DEFAULT_CONFIG))
-                )
-            else:
-                cur.execute(
-                    "INSERT OR IGNORE INTO settings (key, config) VALUES (?, ?)",
-                    (key, json.dumps(DEFAULT_CONFIG))
-                )
-            db.commit()
-            db.close()
-            return DEFAULT_CONFIG
-        
         db.close()
-        return json.loads(result[0])
-        
+
+        # Reads never write: an absent row just means defaults. The row is
+        # created lazily by set_config/patch_config, which already upsert.
+        return result[0] if result else _DEFAULT_CFG_JSON
+
     except Exception as e:
         db.close()
         print(f"Error in get_config: {e}")
-        return DEFAULT_CONFIG
+        return _DEFAULT_CFG_JSON
+
+@app.get("/api/config/{key}")
+async def get_config(key: str):
+    """Get config for a license key"""
+    cached = _config_read_cache.get(key)
+    if cached and cached[0] > time.monotonic():
+        return Response(content=cached[1], media_type="application/json")
+
+    fut = _config_inflight.get(key)
+    if fut is not None:
+        return Response(content=await fut, media_type="application/json")
+
+    fut = asyncio.get_running_loop().create_future()
+    _config_inflight[key] = fut
+    try:
+        result = await asyncio.to_thread(_read_config, key)
+        _cache_put(_config_read_cache, key, (time.monotonic() + _CONFIG_READ_TTL, result))
+        fut.set_result(result)
+    except Exception as e:
+        fut.set_exception(e)
+        raise
+    finally:
+        _config_inflight.pop(key, None)
+    return Response(content=result, media_type="application/json")
 
 @app.post("/api/config/{key}")
 def set_config(key: str, data: dict):
@@ -340,29 +511,175 @@ def set_config(key: str, data: dict):
     db = get_db()
     cur = db.cursor()
     
+    payload = json.dumps(data)
+
     try:
         if USE_POSTGRES:
             cur.execute(
                 """INSERT INTO settings (key, config) VALUES (%s, %s)
                    ON CONFLICT (key) DO UPDATE SET config = EXCLUDED.config""",
-                (key, json.dumps(data))
+                (key, payload)
             )
         else:
             cur.execute(
                 """INSERT INTO settings (key, config) VALUES (?, ?)
                    ON CONFLICT (key) DO UPDATE SET config = excluded.config""",
-                (key, json.dumps(data))
+                (key, payload)
             )
-        
+
         db.commit()
         db.close()
+        notify_config_change(key, payload)
         return {"status": "ok"}
-        
+
     except Exception as e:
         db.close()
         print(f"Error in set_config: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def _apply_config_changes(config, changes):
+    """Apply flat 'section.field' paths to a config dict"""
+    for path, value in changes.items():
+        section, _, field = path.partition(".")
+        if field:
+            config.setdefault(section, {})[field] = value
+        else:
+            config[section] = value
+    return config
+
+@app.patch("/api/config/{key}")
+def patch_config(key: str, changes: dict):
+    """Merge only the changed fields into a stored config, in one SQL statement"""
+    db = get_db()
+    cur = db.cursor()
+
+    try:
+        if USE_POSTGRES:
+            # Chain jsonb_set so the merge happens server-side in one
+            # UPDATE. jsonb_set never creates missing parents, so build
+            # each section's object first — seeded from the stored value
+            # or an empty object — and set it whole; this keeps parity
+            # with the SQLite json_patch branch when a section is absent.
+            grouped = {}
+            for path, value in changes.items():
+                section, _, field = path.partition(".")
+                grouped.setdefault(section, []).append((field, value))
+
+            expr = "config::jsonb"
+            params = []
+            for section, items in grouped.items():
+                parent = "COALESCE(config::jsonb -> %s, '{}'::jsonb)"
+                parent_params = [section]
+                for field, value in items:
+                    if field:
+                        parent = f"jsonb_set({parent}, %s, %s::jsonb)"
+                        parent_params.append([field])
+                        parent_params.append(json.dumps(value))
+                    else:
+                        # Whole-section assignment discards anything staged
+                        parent = "%s::jsonb"
+                        parent_params = [json.dumps(value)]
+                expr = f"jsonb_set({expr}, %s, {parent})"
+                params.append([section])
+                params.extend(parent_params)
+            cur.execute(
+                f"UPDATE settings SET config = ({expr})::text WHERE key=%s",
+                (*params, key),
+            )
+        else:
+            # Chain json_set the same way. json_patch was RFC-7386: it
+            # deep-merged whole-section writes and deleted null fields,
+            # where jsonb_set assigns and stores null — json_set matches
+            # jsonb_set on both, so one PATCH body now means one result
+            # on either backend. It also creates missing parents itself.
+            expr = "config"
+            params = []
+            for path, value in changes.items():
+                section, _, field = path.partition(".")
+                expr = f"json_set({expr}, ?, json(?))"
+                params.append(f'$."{section}"."{field}"' if field else f'$."{section}"')
+                params.append(json.dumps(value))
+            cur.execute(
+                f"UPDATE settings SET config = {expr} WHERE key=?",
+                (*params, key),
+            )
+
+        if cur.rowcount == 0:
+            # First write for this key: seed from the defaults
+            config = _apply_config_changes(json.loads(_DEFAULT_CFG_JSON), changes)
+            config_json = json.dumps(config)
+            if USE_POSTGRES:
+                cur.execute(
+                    """INSERT INTO settings (key, config) VALUES (%s, %s)
+                       ON CONFLICT (key) DO UPDATE SET config = EXCLUDED.config""",
+                    (key, config_json)
+                )
+            else:
+                cur.execute(
+                    """INSERT INTO settings (key, config) VALUES (?, ?)
+                       ON CONFLICT (key) DO UPDATE SET config = excluded.config""",
+                    (key, config_json)
+                )
+            db.commit()
+        else:
+            db.commit()
+            cur.execute(q("SELECT config FROM settings WHERE key=%s"), (key,))
+            config_json = cur.fetchone()[0]
+
+        db.close()
+        notify_config_change(key, config_json)
+        return {"status": "ok"}
+
+    except Exception as e:
+        db.close()
+        print(f"Error in patch_config: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+# === CONFIG PUSH (SSE) ===
+
+# Open SSE streams per license key, fed by notify_config_change
+config_listeners = {}
+_event_loop = None
+
+@app.on_event("startup")
+async def capture_event_loop():
+    global _event_loop
+    _event_loop = asyncio.get_running_loop()
+    # Sync handlers run on the AnyIO threadpool, which defaults to 40 tokens
+    # and caps concurrent DB-bound requests well below what the pool can
+    # serve. Scale it to the pool so connections, not threads, are the limit.
+    import anyio
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = max(limiter.total_tokens, int(os.getenv("DB_POOL_MAX", "30")) * 2)
+
+def notify_config_change(key, config_json):
+    """Push a changed config to any open streams for this key"""
+    _config_read_cache.pop(key, None)
+    if _event_loop is None:
+        return
+    for queue in list(config_listeners.get(key, [])):
+        _event_loop.call_soon_threadsafe(queue.put_nowait, config_json)
+
+@app.get("/api/config/{key}/stream")
+async def stream_config(key: str):
+    """Server-sent events stream of config changes for a license key"""
+    queue = asyncio.Queue()
+    config_listeners.setdefault(key, set()).add(queue)
+
+    async def event_stream():
+        try:
+            while True:
+                payload = await queue.get()
+                yield f"data: {payload}\n\n"
+        finally:
+            listeners = config_listeners.get(key)
+            if listeners:
+                listeners.discard(queue)
+                if not listeners:
+                    config_listeners.pop(key, None)
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
 # === SAVED CONFIGS ENDPOINTS ===
 
 @app.get("/api/configs/{license_key}/list")
@@ -384,16 +701,14 @@ def save_config(license_key: str, data: SavedConfigRequest):
     cur = db.cursor()
     
     try:
-        cur.execute(q("SELECT id FROM saved_configs WHERE license_key=%s AND config_name=%s"), (license_key, data.config_name))
-        existing = cur.fetchone()
-        
-        if existing:
-            cur.execute(q("UPDATE saved_configs SET config_data=%s WHERE license_key=%s AND config_name=%s"),
-                       (json.dumps(data.config_data), license_key, data.config_name))
-        else:
-            cur.execute(q("INSERT INTO saved_configs (license_key, config_name, config_data, created_at) VALUES (%s, %s, %s, %s)"),
-                       (license_key, data.config_name, json.dumps(data.config_data), datetime.now().isoformat()))
-        
+        # Single upsert on the (license_key, config_name) unique constraint;
+        # same pattern set_config uses for settings
+        cur.execute(q(
+            "INSERT INTO saved_configs (license_key, config_name, config_data, created_at) "
+            "VALUES (%s, %s, %s, %s) "
+            "ON CONFLICT (license_key, config_name) DO UPDATE SET config_data=EXCLUDED.config_data, created_at=EXCLUDED.created_at"
+        ), (license_key, data.config_name, json.dumps(data.config_data), _now_iso()))
+
         db.commit()
         db.close()
         return {"success": True, "message": "Config saved"}
@@ -409,11 +724,12 @@ def load_config(license_key: str, config_name: str):
     cur.execute(q("SELECT config_data FROM saved_configs WHERE license_key=%s AND config_name=%s"), (license_key, config_name))
     row = cur.fetchone()
     db.close()
-    
+
     if not row:
         raise HTTPException(status_code=404, detail="Config not found")
-    
-    return json.loads(row[0])
+
+    # Stored value is already JSON text; send it through untouched
+    return Response(content=row[0], media_type="application/json")
 
 @app.post("/api/configs/{license_key}/rename")
 def rename_config(license_key: str, data: dict):
@@ -443,29 +759,60 @@ def delete_config(license_key: str, config_name: str):
 
 # === PUBLIC CONFIGS ===
 
+# Short-TTL cache for the read-heavy browse list; writes clear it
+_PUB_CACHE_TTL = 5.0
+_pub_cache = {}
+
 @app.get("/api/public-configs")
-def get_public_configs():
-    """Get all public configs"""
+def get_public_configs(request: Request, response: Response, page: int = 1, page_size: int = 0):
+    """Get public configs; pass page/page_size to fetch one page at a time"""
+    # Clamp before anything keys off them: both are caller-chosen and feed
+    # the cache key and the OFFSET arithmetic
+    page = max(page, 1)
+    page_size = min(max(page_size, 0), 100)
+    cached = _pub_cache.get((page, page_size))
+    if cached and cached[0] > time.monotonic():
+        _, etag, payload = cached
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304)
+        response.headers["ETag"] = etag
+        return payload
+
     try:
         db = get_db()
-        cur = db.cursor()
-        cur.execute(q("SELECT id, config_name, author_name, game_name, description, downloads, created_at FROM public_configs ORDER BY created_at DESC"))
-        rows = cur.fetchall()
+        cur = dict_cursor(db)
+
+        # SUM(downloads) is in the seed so counter flushes invalidate the
+        # ETag too — creation time and row count alone miss them
+        cur.execute(q("SELECT COUNT(*) AS n, MAX(created_at) AS latest, COALESCE(SUM(downloads), 0) AS dls FROM public_configs"))
+        meta = cur.fetchone()
+        count, latest, downloads_total = meta["n"], meta["latest"], meta["dls"]
+        etag = f'W/"{latest or 0}-{count}-{downloads_total}-{page}-{page_size}"'
+
+        if request.headers.get("if-none-match") == etag:
+            db.close()
+            return Response(status_code=304)
+
+        # N.B. any future per-config enrichment (author profiles, ratings,
+        # fresh download totals) belongs in this query as a LEFT JOIN or
+        # lateral aggregate — never as a per-row fetch loop over `configs`.
+        if page_size > 0:
+            # Paged query rides ix_public_configs_created; OFFSET stays small
+            # because the browse UI only walks forward a few pages
+            cur.execute(q(
+                "SELECT id, config_name, author_name, game_name, description, downloads, created_at "
+                "FROM public_configs ORDER BY created_at DESC LIMIT %s OFFSET %s"
+            ), (page_size, (max(page, 1) - 1) * page_size))
+        else:
+            cur.execute(q("SELECT id, config_name, author_name, game_name, description, downloads, created_at FROM public_configs ORDER BY created_at DESC"))
+        # Column names match the response shape, so rows go out as-is
+        configs = cur.fetchall()
         db.close()
-        
-        configs = []
-        for row in rows:
-            configs.append({
-                "id": row[0],
-                "config_name": row[1],
-                "author_name": row[2],
-                "game_name": row[3],
-                "description": row[4],
-                "downloads": row[5],
-                "created_at": row[6]
-            })
-        
-        return {"configs": configs}
+
+        payload = {"configs": configs, "total": count}
+        _cache_put(_pub_cache, (page, page_size), (time.monotonic() + _PUB_CACHE_TTL, etag, payload))
+        response.headers["ETag"] = etag
+        return payload
     except Exception as e:
         print(f"Error: {e}")
         return {"configs": []}
@@ -478,9 +825,10 @@ def create_public_config(data: PublicConfig):
     
     try:
         cur.execute(q("INSERT INTO public_configs (config_name, author_name, game_name, description, config_data, license_key, created_at, downloads) VALUES (%s, %s, %s, %s, %s, %s, %s, 0)"),
-                   (data.config_name, data.author_name, data.game_name, data.description, json.dumps(data.config_data), "web-user", datetime.now().isoformat()))
+                   (data.config_name, data.author_name, data.game_name, data.description, json.dumps(data.config_data), "web-user", _now_iso()))
         db.commit()
         db.close()
+        _pub_cache.clear()
         return {"success": True}
     except Exception as e:
         db.close()
@@ -490,32 +838,64 @@ def create_public_config(data: PublicConfig):
 def get_public_config(config_id: int):
     """Get a single config"""
     db = get_db()
-    cur = db.cursor()
+    cur = dict_cursor(db)
     cur.execute(q("SELECT id, config_name, author_name, game_name, description, config_data, downloads FROM public_configs WHERE id=%s"), (config_id,))
     row = cur.fetchone()
     db.close()
-    
+
     if not row:
         raise HTTPException(status_code=404, detail="Not found")
-    
-    return {
-        "id": row[0],
-        "config_name": row[1],
-        "author_name": row[2],
-        "game_name": row[3],
-        "description": row[4],
-        "config_data": json.loads(row[5]) if row[5] else {},
-        "downloads": row[6]
-    }
 
-@app.post("/api/public-configs/{config_id}/download")
-def download_config(config_id: int):
-    """Increment downloads"""
+    # config_data is already JSON text; splice it into the response body
+    # verbatim rather than paying a json.loads + re-serialize round trip
+    cfg = row.pop("config_data")
+    body = json.dumps(row)[:-1] + ',"config_data":' + (cfg if cfg else "{}") + "}"
+    return Response(content=body, media_type="application/json")
+
+# Download clicks buffer in memory and flush in one batched commit every
+# couple of seconds; a slightly stale counter is fine, per-click fsyncs
+# are not
+_DOWNLOAD_FLUSH_INTERVAL = 2.0
+_pending_downloads = Counter()
+_pending_downloads_lock = threading.Lock()
+
+def _flush_downloads():
+    with _pending_downloads_lock:
+        if not _pending_downloads:
+            return
+        snapshot = dict(_pending_downloads)
+        _pending_downloads.clear()
+
     db = get_db()
     cur = db.cursor()
-    cur.execute(q("UPDATE public_configs SET downloads = downloads + 1 WHERE id=%s"), (config_id,))
+    cur.executemany(
+        q("UPDATE public_configs SET downloads = downloads + %s WHERE id=%s"),
+        [(n, config_id) for config_id, n in snapshot.items()],
+    )
     db.commit()
     db.close()
+    _pub_cache.clear()
+
+@app.on_event("startup")
+async def start_download_flusher():
+    async def flusher():
+        while True:
+            await asyncio.sleep(_DOWNLOAD_FLUSH_INTERVAL)
+            try:
+                await asyncio.to_thread(_flush_downloads)
+            except Exception as e:
+                print(f"Error flushing downloads: {e}")
+    asyncio.create_task(flusher())
+
+@app.on_event("shutdown")
+def drain_download_counts():
+    _flush_downloads()
+
+@app.post("/api/public-configs/{config_id}/download")
+def download_config(config_id: int):
+    """Increment downloads"""
+    with _pending_downloads_lock:
+        _pending_downloads[config_id] += 1
     return {"success": True}
 
 # === KEY MANAGEMENT ===
@@ -523,14 +903,17 @@ def download_config(config_id: int):
 @app.post("/api/keys/create")
 def create_key(data: KeyCreate):
     """Create a license key"""
-    key = f"{secrets.randbelow(10000):04d}-{secrets.randbelow(10000):04d}-{secrets.randbelow(10000):04d}-{secrets.randbelow(10000):04d}"
+    # One CSPRNG draw sliced into four groups; 65536→10000 modulo bias is
+    # irrelevant for a license key
+    a, b, c, d = struct.unpack("<HHHH", secrets.token_bytes(8))
+    key = f"{a % 10000:04d}-{b % 10000:04d}-{c % 10000:04d}-{d % 10000:04d}"
     
     db = get_db()
     cur = db.cursor()
     
     try:
         cur.execute(q("INSERT INTO keys (key, duration, created_at, active, created_by) VALUES (%s, %s, %s, 0, %s)"),
-                   (key, data.duration, datetime.now().isoformat(), data.created_by))
+                   (key, data.duration, _now_iso(), data.created_by))
         db.commit()
         db.close()
         return {"key": key, "duration": data.duration}
@@ -546,27 +929,37 @@ def delete_key(license_key: str):
     cur.execute(q("DELETE FROM keys WHERE key=%s"), (license_key,))
     db.commit()
     db.close()
+    _invalidate_validate_cache(license_key)
     return {"success": True}
 
 # === DASHBOARD API ===
 
+# Same cache-aside shape as the validate cache; key rows change rarely and
+# the dashboard polls often. Redis would only matter with multiple workers.
+_DASH_CACHE_TTL = 15.0
+_dash_cache = {}
+
 @app.get("/api/dashboard/{license_key}")
 def get_dashboard_data(license_key: str):
     """Get dashboard data"""
+    cached = _dash_cache.get(license_key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
     db = get_db()
     cur = db.cursor()
-    
+
     cur.execute(q("SELECT key, duration, expires_at, active, hwid, redeemed_by, hwid_resets FROM keys WHERE key=%s"), (license_key,))
     result = cur.fetchone()
-    
+
     db.close()
-    
+
     if not result:
         raise HTTPException(status_code=404, detail="Not found")
-    
+
     key, duration, expires_at, active, hwid, discord_id, hwid_resets = result
-    
-    return {
+
+    payload = {
         "license_key": key,
         "duration": duration,
         "expires_at": expires_at,
@@ -575,6 +968,8 @@ def get_dashboard_data(license_key: str):
         "discord_id": discord_id,
         "hwid_resets": hwid_resets if hwid_resets else 0
     }
+    _cache_put(_dash_cache, license_key, (time.monotonic() + _DASH_CACHE_TTL, payload))
+    return payload
 
 @app.post("/api/redeem")
 def redeem_key(data: RedeemRequest):
@@ -582,33 +977,41 @@ def redeem_key(data: RedeemRequest):
     db = get_db()
     cur = db.cursor()
     
-    cur.execute(q("SELECT key, duration, redeemed_at FROM keys WHERE key=%s"), (data.key,))
-    result = cur.fetchone()
-    
-    if not result:
-        db.close()
-        raise HTTPException(status_code=404, detail="Invalid key")
-    
-    key, duration, redeemed_at = result
-    
-    if redeemed_at:
+    now = datetime.now()
+
+    # One guarded UPDATE; `redeemed_at IS NULL` serializes concurrent
+    # redeems so a key can never be claimed twice. Expiry stamps are
+    # precomputed per duration and picked in SQL since duration lives on
+    # the row.
+    cur.execute(q(
+        "UPDATE keys SET redeemed_at=%s, redeemed_by=%s, active=1, "
+        "expires_at = CASE duration "
+        "WHEN 'monthly' THEN %s WHEN 'weekly' THEN %s WHEN '3monthly' THEN %s "
+        "ELSE NULL END "
+        "WHERE key=%s AND redeemed_at IS NULL RETURNING duration, expires_at"
+    ), (
+        now.isoformat(), data.discord_id,
+        (now + timedelta(days=30)).isoformat(),
+        (now + timedelta(days=7)).isoformat(),
+        (now + timedelta(days=90)).isoformat(),
+        data.key,
+    ))
+    row = cur.fetchone()
+
+    if not row:
+        # Miss: classify with a SELECT off the hot path
+        cur.execute(q("SELECT redeemed_at FROM keys WHERE key=%s"), (data.key,))
+        existing = cur.fetchone()
         db.close()
+        if not existing:
+            raise HTTPException(status_code=404, detail="Invalid key")
         raise HTTPException(status_code=400, detail="Already redeemed")
-    
-    now = datetime.now()
-    expires_at = None
-    if duration == "monthly":
-        expires_at = (now + timedelta(days=30)).isoformat()
-    elif duration == "weekly":
-        expires_at = (now + timedelta(days=7)).isoformat()
-    elif duration == "3monthly":
-        expires_at = (now + timedelta(days=90)).isoformat()
-    
-    cur.execute(q("UPDATE keys SET redeemed_at=%s, redeemed_by=%s, expires_at=%s, active=1 WHERE key=%s"),
-               (now.isoformat(), data.discord_id, expires_at, data.key))
+
     db.commit()
     db.close()
-    
+    _invalidate_validate_cache(data.key)
+
+    duration, expires_at = row
     return {"success": True, "duration": duration, "expires_at": expires_at, "message": "Key redeemed successfully"}
 
 @app.post("/api/reset-hwid/{license_key}")
@@ -617,20 +1020,22 @@ def reset_hwid(license_key: str):
     db = get_db()
     cur = db.cursor()
     
-    cur.execute(q("SELECT hwid_resets FROM keys WHERE key=%s"), (license_key,))
-    result = cur.fetchone()
-    
-    if not result:
+    # Increment in SQL so concurrent resets never read the same counter
+    cur.execute(q(
+        "UPDATE keys SET hwid=NULL, hwid_resets=COALESCE(hwid_resets, 0)+1 "
+        "WHERE key=%s RETURNING hwid_resets"
+    ), (license_key,))
+    row = cur.fetchone()
+
+    if not row:
         db.close()
         raise HTTPException(status_code=404, detail="Not found")
-    
-    resets = result[0] if result[0] else 0
-    
-    cur.execute(q("UPDATE keys SET hwid=NULL, hwid_resets=%s WHERE key=%s"), (resets + 1, license_key))
+
     db.commit()
     db.close()
-    
-    return {"success": True, "hwid_resets": resets + 1}
+    _invalidate_validate_cache(license_key)
+
+    return {"success": True, "hwid_resets": row[0]}
 
 @app.get("/api/users/{user_id}/license")
 def get_user_license(user_id: str):
@@ -638,19 +1043,22 @@ def get_user_license(user_id: str):
     db = get_db()
     cur = db.cursor()
     
-    cur.execute(q("SELECT key, duration, expires_at, redeemed_at, hwid, active FROM keys WHERE redeemed_by=%s"), (user_id,))
+    # Expiry computed in SQL; ISO-8601 text orders the same as timestamps
+    cur.execute(q(
+        "SELECT key, duration, expires_at, redeemed_at, hwid, active, "
+        "(expires_at IS NOT NULL AND expires_at <= %s) AS expired "
+        "FROM keys WHERE redeemed_by=%s"
+    ), (_now_iso(), user_id))
     result = cur.fetchone()
     db.close()
-    
+
     if not result:
         return {"active": False, "message": "No license found"}
-    
-    key, duration, expires_at, redeemed_at, hwid, active = result
-    
-    if expires_at:
-        is_expired = datetime.now() > datetime.fromisoformat(expires_at)
-        if is_expired:
-            return {"active": False, "expired": True, "key": key}
+
+    key, duration, expires_at, redeemed_at, hwid, active, expired = result
+
+    if expired:
+        return {"active": False, "expired": True, "key": key}
     
     return {
         "active": True,
@@ -667,19 +1075,18 @@ def delete_user_license(user_id: str):
     db = get_db()
     cur = db.cursor()
     
-    cur.execute(q("SELECT key FROM keys WHERE redeemed_by=%s"), (user_id,))
+    cur.execute(q("DELETE FROM keys WHERE redeemed_by=%s RETURNING key"), (user_id,))
     result = cur.fetchone()
-    
+
     if not result:
         db.close()
         raise HTTPException(status_code=404, detail="No license found")
-    
-    key = result[0]
-    cur.execute(q("DELETE FROM keys WHERE redeemed_by=%s"), (user_id,))
+
     db.commit()
     db.close()
-    
-    return {"status": "deleted", "key": key, "user_id": user_id}
+    _invalidate_validate_cache(result[0])
+
+    return {"status": "deleted", "key": result[0], "user_id": user_id}
 
 @app.post("/api/users/{user_id}/reset-hwid")
 def reset_user_hwid(user_id: str):
@@ -687,20 +1094,24 @@ def reset_user_hwid(user_id: str):
     db = get_db()
     cur = db.cursor()
     
-    cur.execute(q("SELECT hwid, hwid_resets FROM keys WHERE redeemed_by=%s"), (user_id,))
+    cur.execute(q("SELECT key, hwid FROM keys WHERE redeemed_by=%s"), (user_id,))
     result = cur.fetchone()
-    
+
     if not result:
         db.close()
         raise HTTPException(status_code=404, detail="No license found")
-    
-    old_hwid, resets = result
-    resets = resets if resets else 0
-    
-    cur.execute(q("UPDATE keys SET hwid=NULL, hwid_resets=%s WHERE redeemed_by=%s"), (resets + 1, user_id))
+
+    key, old_hwid = result
+
+    # Counter bumped in SQL; the SELECT above only survives because the
+    # response reports the pre-reset hwid (SQLite RETURNING can't subquery)
+    cur.execute(q(
+        "UPDATE keys SET hwid=NULL, hwid_resets=COALESCE(hwid_resets, 0)+1 WHERE redeemed_by=%s"
+    ), (user_id,))
     db.commit()
     db.close()
-    
+    _invalidate_validate_cache(key)
+
     return {"status": "reset", "user_id": user_id, "old_hwid": old_hwid}
 
 @app.get("/api/keepalive")
@@ -1131,6 +1542,8 @@ _INDEX_HTML = f"""<!DOCTYPE html>
       padding: 24px;
       transition: all 0.3s;
       cursor: pointer;
+      content-visibility: auto;
+      contain-intrinsic-size: 200px 280px;
     }}
 
     .config-card:hover {{
@@ -1546,12 +1959,52 @@ _INDEX_HTML = f"""<!DOCTYPE html>
     </div>
   </div>
 
+  <template id="cardTpl">
+    <div class="config-card">
+      <div class="config-name"></div>
+      <div class="config-game"></div>
+      <div class="config-description"></div>
+      <div class="config-footer">
+        <div class="by"></div>
+        <div class="dl"></div>
+      </div>
+    </div>
+  </template>
+
   <script>
     let currentUser = null;
     let allConfigs = [];
     let currentPage = 1;
     let currentViewConfig = null;
-    const CONFIGS_PER_PAGE = 6;
+
+    function cardsPerPage() {{
+      const w = window.innerWidth;
+      return w < 600 ? 4 : w < 1000 ? 8 : 12;
+    }}
+
+    let CONFIGS_PER_PAGE = cardsPerPage();
+
+    let resizeTimer = null;
+    window.addEventListener('resize', () => {{
+      clearTimeout(resizeTimer);
+      resizeTimer = setTimeout(() => {{
+        CONFIGS_PER_PAGE = cardsPerPage();
+        renderConfigsPage();
+      }}, 200);
+    }});
+
+    // Coalesce repeat schedules of the same callback into one paint;
+    // tracked per function so unrelated paints (modal vs grid) can't
+    // cancel each other's pending frame
+    const scheduledFrames = new Map();
+    function schedule(fn) {{
+      const pending = scheduledFrames.get(fn);
+      if (pending) cancelAnimationFrame(pending);
+      scheduledFrames.set(fn, requestAnimationFrame(() => {{
+        scheduledFrames.delete(fn);
+        fn();
+      }}));
+    }}
 
     function showPage(pageId) {{
       document.querySelectorAll('.page').forEach(p => p.classList.remove('active'));
@@ -1593,12 +2046,16 @@ _INDEX_HTML = f"""<!DOCTYPE html>
               license_key: licenseKey
             }};
             
-            document.getElementById('userArea').innerHTML = `
-              <div class="user-info" onclick="logout()">
-                <span>${{licenseKey.substring(0, 12)}}...</span>
-              </div>
-            `;
-            
+            // User-controlled text goes in via textContent, never markup
+            const info = document.createElement('div');
+            info.className = 'user-info';
+            info.onclick = logout;
+            const label = document.createElement('span');
+            label.textContent = `${{licenseKey.substring(0, 12)}}...`;
+            info.appendChild(label);
+            document.getElementById('userArea').replaceChildren(info);
+
+
             closeLoginModal();
             loadConfigs();
           }} else {{
@@ -1627,61 +2084,129 @@ _INDEX_HTML = f"""<!DOCTYPE html>
       `;
     }}
 
+    // Fresh-for-30s memory cache plus in-flight de-dup, so tab switches
+    // and concurrent triggers share one request instead of refetching
+    const configCache = {{ data: null, ts: 0, inflight: null }};
+
     async function loadConfigs() {{
+      if (configCache.data && Date.now() - configCache.ts < 30000) {{
+        allConfigs = configCache.data;
+        renderConfigsPage();
+        return;
+      }}
+      if (configCache.inflight) {{
+        await configCache.inflight;
+        allConfigs = configCache.data || [];
+        renderConfigsPage();
+        return;
+      }}
       try {{
-        const res = await fetch('/api/public-configs');
-        const data = await res.json();
-        
-        allConfigs = data.configs || [];
+        configCache.inflight = fetchConfigs();
+        await configCache.inflight;
+        allConfigs = configCache.data || [];
         renderConfigsPage();
       }} catch (e) {{
         console.error('Load error:', e);
         document.getElementById('configsContent').innerHTML = '<p>Error loading configs</p>';
+      }} finally {{
+        configCache.inflight = null;
+      }}
+    }}
+
+    async function fetchConfigs() {{
+      const lastEtag = localStorage.getItem('axion_configs_etag');
+      const cached = localStorage.getItem('axion_configs_cache');
+      const headers = {{}};
+      if (lastEtag && cached) headers['If-None-Match'] = lastEtag;
+
+      const res = await fetch('/api/public-configs', {{ headers }});
+
+      if (res.status === 304 && cached) {{
+        configCache.data = JSON.parse(cached);
+      }} else {{
+        const data = await res.json();
+        configCache.data = data.configs || [];
+        const etag = res.headers.get('ETag');
+        if (etag) {{
+          localStorage.setItem('axion_configs_etag', etag);
+          localStorage.setItem('axion_configs_cache', JSON.stringify(configCache.data));
+        }}
       }}
+      configCache.ts = Date.now();
     }}
 
     function renderConfigsPage() {{
+      schedule(renderConfigsPageNow);
+    }}
+
+    function renderConfigsPageNow() {{
       const startIndex = (currentPage - 1) * CONFIGS_PER_PAGE;
       const endIndex = startIndex + CONFIGS_PER_PAGE;
       const pageConfigs = allConfigs.slice(startIndex, endIndex);
       const totalPages = Math.ceil(allConfigs.length / CONFIGS_PER_PAGE);
 
-      let html = '<button class="create-btn" onclick="openCreateModal()">+ Create Config</button>';
-      html += '<div class="config-grid">';
-      
+      // Static scaffold built once; renders only swap grid children and
+      // pagination buttons instead of re-parsing the whole section
+      const content = document.getElementById('configsContent');
+      let grid = document.getElementById('configGrid');
+      if (!grid) {{
+        content.innerHTML =
+          '<button class="create-btn" onclick="openCreateModal()">+ Create Config</button>' +
+          '<div class="config-grid" id="configGrid"></div>' +
+          '<div class="pagination" id="configPagination" style="display:none"></div>';
+        grid = document.getElementById('configGrid');
+      }}
+
+      const tpl = document.getElementById('cardTpl');
+      const frag = document.createDocumentFragment();
+
       if (pageConfigs.length > 0) {{
         pageConfigs.forEach(config => {{
-          html += `
-            <div class="config-card" onclick="viewConfig(${{config.id}})">
-              <div class="config-name">${{config.config_name}}</div>
-              <div class="config-game">${{config.game_name}}</div>
-              <div class="config-description">${{config.description}}</div>
-              <div class="config-footer">
-                <div>by ${{config.author_name}}</div>
-                <div>${{config.downloads}} downloads</div>
-              </div>
-            </div>
-          `;
+          const node = tpl.content.firstElementChild.cloneNode(true);
+          node.onclick = () => viewConfig(config.id);
+          // Warm the detail cache while the user hovers; the click then
+          // opens instantly from cache
+          node.addEventListener('mouseenter', () => idle(() => prefetchDetail(config.id)), {{ once: true }});
+          node.querySelector('.config-name').textContent = config.config_name;
+          node.querySelector('.config-game').textContent = config.game_name;
+          node.querySelector('.config-description').textContent = config.description;
+          node.querySelector('.by').textContent = `by ${{config.author_name}}`;
+          node.querySelector('.dl').textContent = `${{config.downloads}} downloads`;
+          frag.appendChild(node);
         }});
       }} else {{
-        html += '<p style="color: #888; text-align: center; padding: 40px;">No configs yet! Be the first to create one.</p>';
+        const empty = document.createElement('p');
+        empty.style.cssText = 'color: #888; text-align: center; padding: 40px;';
+        empty.textContent = 'No configs yet! Be the first to create one.';
+        frag.appendChild(empty);
       }}
-      
-      html += '</div>';
 
-      if (totalPages > 1) {{
-        html += '<div class="pagination">';
-        html += `<button class="page-btn" onclick="changePage(${{currentPage - 1}})" ${{currentPage === 1 ? 'disabled' : ''}}>Previous</button>`;
-        
-        for (let i = 1; i <= totalPages; i++) {{
-          html += `<button class="page-btn ${{i === currentPage ? 'active' : ''}}" onclick="changePage(${{i}})">${{i}}</button>`;
-        }}
-        
-        html += `<button class="page-btn" onclick="changePage(${{currentPage + 1}})" ${{currentPage === totalPages ? 'disabled' : ''}}>Next</button>`;
-        html += '</div>';
+      grid.replaceChildren(frag);
+      renderPagination(totalPages);
+    }}
+
+    function renderPagination(totalPages) {{
+      const pag = document.getElementById('configPagination');
+      if (totalPages <= 1) {{
+        pag.style.display = 'none';
+        return;
       }}
-      
-      document.getElementById('configsContent').innerHTML = html;
+      pag.style.display = '';
+
+      // Window of first/last/current±2 keeps the control O(1) no matter
+      // how many pages exist
+      const wanted = new Set([1, totalPages, currentPage - 2, currentPage - 1, currentPage, currentPage + 1, currentPage + 2]);
+      const pages = [...wanted].filter(p => p >= 1 && p <= totalPages).sort((a, b) => a - b);
+
+      let html = `<button class="page-btn" onclick="changePage(${{currentPage - 1}})" ${{currentPage === 1 ? 'disabled' : ''}}>Previous</button>`;
+      let prev = 0;
+      for (const i of pages) {{
+        if (i - prev > 1) html += '<span class="page-gap">…</span>';
+        html += `<button class="page-btn ${{i === currentPage ? 'active' : ''}}" onclick="changePage(${{i}})">${{i}}</button>`;
+        prev = i;
+      }}
+      html += `<button class="page-btn" onclick="changePage(${{currentPage + 1}})" ${{currentPage === totalPages ? 'disabled' : ''}}>Next</button>`;
+      pag.innerHTML = html;
     }}
 
     function changePage(page) {{
@@ -1700,14 +2225,16 @@ _INDEX_HTML = f"""<!DOCTYPE html>
         const data = await res.json();
         
         const select = document.getElementById('savedConfigSelect');
-        select.innerHTML = '<option value="">Select a config...</option>';
-        
+
         if (data.configs && data.configs.length > 0) {{
-          data.configs.forEach(cfg => {{
-            select.innerHTML += `<option value="${{cfg.name}}">${{cfg.name}}</option>`;
-          }});
+          // new Option sets the label via text, not markup, and the
+          // fragment means one DOM update instead of N innerHTML reparses
+          const frag = document.createDocumentFragment();
+          frag.appendChild(new Option('Select a config...', ''));
+          data.configs.forEach(cfg => frag.appendChild(new Option(cfg.name, cfg.name)));
+          select.replaceChildren(frag);
         }} else {{
-          select.innerHTML = '<option value="">No saved configs found</option>';
+          select.replaceChildren(new Option('No saved configs found', ''));
         }}
       }} catch (e) {{
         console.error('Error loading configs:', e);
@@ -1753,6 +2280,7 @@ _INDEX_HTML = f"""<!DOCTYPE html>
         if (res.ok) {{
           alert('Config published successfully!');
           closeCreateModal();
+          configCache.ts = 0;
           loadConfigs();
         }} else {{
           const error = await res.json();
@@ -1763,22 +2291,50 @@ _INDEX_HTML = f"""<!DOCTYPE html>
       }}
     }}
 
+    // Session-scoped detail memo + in-flight de-dup; double-clicks share
+    // one GET and each config counts at most one download per session
+    const detailCache = new Map();
+    const detailInflight = new Map();
+    const downloadSent = new Set();
+
+    const idle = window.requestIdleCallback || (fn => setTimeout(fn, 1));
+
+    function prefetchDetail(configId) {{
+      if (detailCache.has(configId) || detailInflight.has(configId)) return;
+      fetchConfigDetail(configId).catch(() => {{}});
+    }}
+
+    async function fetchConfigDetail(configId) {{
+      if (detailCache.has(configId)) return detailCache.get(configId);
+      if (detailInflight.has(configId)) return detailInflight.get(configId);
+      const p = fetch(`/api/public-configs/${{configId}}`)
+        .then(r => r.json())
+        .then(data => {{ detailCache.set(configId, data); return data; }})
+        .finally(() => detailInflight.delete(configId));
+      detailInflight.set(configId, p);
+      return p;
+    }}
+
     async function viewConfig(configId) {{
       try {{
-        const res = await fetch(`/api/public-configs/${{configId}}`);
-        const data = await res.json();
-        
+        const data = await fetchConfigDetail(configId);
+
         currentViewConfig = data;
+
+        schedule(() => {{
+          document.getElementById('viewConfigName').textContent = data.config_name;
+          document.getElementById('viewGame').textContent = data.game_name;
+          document.getElementById('viewAuthor').textContent = data.author_name;
+          document.getElementById('viewDownloads').textContent = data.downloads;
+          document.getElementById('viewDescription').textContent = data.description;
+
+          document.getElementById('viewModal').classList.add('active');
+        }});
         
-        document.getElementById('viewConfigName').textContent = data.config_name;
-        document.getElementById('viewGame').textContent = data.game_name;
-        document.getElementById('viewAuthor').textContent = data.author_name;
-        document.getElementById('viewDownloads').textContent = data.downloads;
-        document.getElementById('viewDescription').textContent = data.description;
-        
-        document.getElementById('viewModal').classList.add('active');
-        
-        fetch(`/api/public-configs/${{configId}}/download`, {{ method: 'POST' }});
+        if (!downloadSent.has(configId)) {{
+          downloadSent.add(configId);
+          fetch(`/api/public-configs/${{configId}}/download`, {{ method: 'POST' }});
+        }}
       }} catch (e) {{
         alert('Error loading config');
       }}
@@ -1832,11 +2388,37 @@ _INDEX_HTML = f"""<!DOCTYPE html>
 </html>
 """
 
+_INDEX_HTML_BYTES = _INDEX_HTML.encode("utf-8")
+_INDEX_HTML_GZ = gzip.compress(_INDEX_HTML_BYTES, 9)
+_INDEX_HTML_ETAG = f'"{hashlib.sha1(_INDEX_HTML_BYTES).hexdigest()}"'
+# Only the encoded blobs are served; drop the source string from RSS
+del _INDEX_HTML
+
+def _static_page(request, body, body_gz, etag):
+    """Serve a pre-encoded HTML blob, gzipped at import time rather than
+    per request by the middleware.
+
+    The CSS/JS stays inline by design: each page is one deployable string
+    in this file, the whole document already revalidates via ETag (repeat
+    visits cost a 304, not a transfer), and splitting out hashed static
+    assets would add a second round-trip per navigation plus a mount that
+    collides with the /{license_key} catch-all."""
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+    # These pages are static shells — all dynamic state arrives via API
+    # fetches — so let browsers keep them for an hour; after expiry the
+    # ETag revalidates to a 304 and deploys propagate from there
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=3600", "Vary": "Accept-Encoding"}
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        body = body_gz
+    return Response(content=body, media_type="text/html; charset=utf-8", headers=headers)
+
 @app.get("/", response_class=HTMLResponse)
 @app.get("/home", response_class=HTMLResponse)
-def serve_home():
+async def serve_home(request: Request):
     """SPA Homepage with all tabs"""
-    return _INDEX_HTML
+    return _static_page(request, _INDEX_HTML_BYTES, _INDEX_HTML_GZ, _INDEX_HTML_ETAG)
 
 # ============================================================================
 # DASHBOARD WITH ANTI-DEVTOOLS PROTECTION
@@ -2042,7 +2624,7 @@ DASHBOARD_HTML = f"""<!DOCTYPE html>
         localStorage.setItem('axion_dashboard_visited', 'true');
         
         document.getElementById('loginModal').classList.remove('show');
-        loadDashboard();
+        renderDashboard(data);
       }} catch (e) {{
         alert('Error validating license: ' + e.message);
       }}
@@ -2076,31 +2658,35 @@ DASHBOARD_HTML = f"""<!DOCTYPE html>
         }}
         
         const data = await res.json();
-        
-        // Update stats
-        document.getElementById('activeSubs').textContent = data.active ? '1' : '0';
-        document.getElementById('totalResets').textContent = data.hwid_resets || 0;
-        document.getElementById('subStatus').textContent = data.active ? 'Active' : 'Inactive';
-        
-        // Update duration display
-        const durationMap = {{
-          'weekly': 'Weekly',
-          'monthly': 'Monthly',
-          '3monthly': 'Quarterly',
-          'lifetime': 'Lifetime'
-        }};
-        document.getElementById('subDuration').textContent = durationMap[data.duration] || data.duration.toUpperCase();
-        
-        // Update security info
-        document.getElementById('licenseDisplay').textContent = data.license_key;
-        document.getElementById('hwidDisplay').textContent = data.hwid || 'Not bound';
-        
+        renderDashboard(data);
       }} catch (e) {{
         console.error('Error loading dashboard:', e);
         setUnknownState();
       }}
     }}
 
+    // Paint dashboard state from an /api/dashboard-shaped payload; shared
+    // by loadDashboard and flows that already hold fresh data (login)
+    function renderDashboard(data) {{
+      // Update stats
+      document.getElementById('activeSubs').textContent = data.active ? '1' : '0';
+      document.getElementById('totalResets').textContent = data.hwid_resets || 0;
+      document.getElementById('subStatus').textContent = data.active ? 'Active' : 'Inactive';
+
+      // Update duration display
+      const durationMap = {{
+        'weekly': 'Weekly',
+        'monthly': 'Monthly',
+        '3monthly': 'Quarterly',
+        'lifetime': 'Lifetime'
+      }};
+      document.getElementById('subDuration').textContent = durationMap[data.duration] || data.duration.toUpperCase();
+
+      // Update security info
+      document.getElementById('licenseDisplay').textContent = data.license_key;
+      document.getElementById('hwidDisplay').textContent = data.hwid || 'Not bound';
+    }}
+
     // Tab navigation
     document.querySelectorAll('nav a').forEach(link => {{
       link.addEventListener('click', e => {{
@@ -2215,26 +2801,19 @@ DASHBOARD_HTML = f"""<!DOCTYPE html>
 </body>
 </html>"""
 
+_DASHBOARD_HTML_BYTES = DASHBOARD_HTML.encode("utf-8")
+_DASHBOARD_HTML_GZ = gzip.compress(_DASHBOARD_HTML_BYTES, 9)
+_DASHBOARD_HTML_ETAG = f'"{hashlib.sha1(_DASHBOARD_HTML_BYTES).hexdigest()}"'
+del DASHBOARD_HTML
+
+# async: touches no DB, so serving the precomputed blob straight from the
+# event loop skips the threadpool dispatch a sync handler would pay
 @app.get("/dashboard", response_class=HTMLResponse)
-def serve_customer_dashboard():
+async def serve_customer_dashboard(request: Request):
     """Customer Account Dashboard with Modal Login"""
-    return DASHBOARD_HTML
+    return _static_page(request, _DASHBOARD_HTML_BYTES, _DASHBOARD_HTML_GZ, _DASHBOARD_HTML_ETAG)
 
-@app.get("/{license_key}", response_class=HTMLResponse)
-def serve_dashboard(license_key: str):
-    """Personal dashboard"""
-    if license_key in ["api", "favicon.ico", "home"]:
-        raise HTTPException(status_code=404)
-   
-    db = get_db()
-    cur = db.cursor()
-   
-    cur.execute(q("SELECT * FROM keys WHERE key=%s"), (license_key,))
-    result = cur.fetchone()
-    db.close()
-   
-    if not result:
-        return f"""<!DOCTYPE html>
+_INVALID_LICENSE_HTML_BYTES = f"""<!DOCTYPE html>
 <html>
 <head>
 <meta charset="UTF-8">
@@ -2255,9 +2834,9 @@ button:hover{{background:#444}}
 </div>
 {ENHANCED_ANTI_DEVTOOLS_JS}
 </body>
-</html>"""
-   
-    return f"""<!DOCTYPE html>
+</html>""".encode("utf-8")
+
+_USER_DASHBOARD_HTML = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="UTF-8"/>
@@ -2294,7 +2873,7 @@ body{{height:100vh;background:radial-gradient(circle at top,#0f0f0f,#050505);fon
 .slider-label{{position:absolute;left:16px;color:#bfbfbf;font-size:11px;font-weight:normal;z-index:1}}
 .slider-container{{position:absolute;left:16px;width:210px;height:14px;background:#0f0f0f;border:1px solid #2a2a2a;overflow:hidden;z-index:10}}
 .slider-track{{position:absolute;top:0;left:0;width:100%;height:100%;background:#0f0f0f}}
-.slider-fill{{position:absolute;top:0;left:0;height:100%;background:#ccc;width:50%;transition:width 0.1s}}
+.slider-fill{{position:absolute;top:0;left:0;height:100%;background:#ccc;width:100%;transform:scaleX(0.5);transform-origin:left;transition:transform 0.1s;will-change:transform}}
 .slider-value{{position:absolute;top:50%;left:50%;transform:translate(-50%,-50%);font-size:9px;font-weight:bold;pointer-events:none;z-index:3;transition:color 0.2s}}
 .half-panel::-webkit-scrollbar{{width:5px}}
 .half-panel::-webkit-scrollbar-track{{background:#0a0a0a;border-left:1px solid #111}}
@@ -2557,6 +3136,17 @@ body{{height:100vh;background:radial-gradient(circle at top,#0f0f0f,#050505);fon
                     <div class="half-panel">
                         <div class="panel-header">saved configs</div>
                         <div class="config-list" id="configList"></div>
+                        <template id="cfgRowTpl">
+                            <div class="config-item">
+                                <div class="config-name"></div>
+                                <div class="config-dots" data-action="menu">⋮</div>
+                                <div class="config-menu">
+                                    <div class="config-menu-item" data-action="load">Load</div>
+                                    <div class="config-menu-item" data-action="rename">Rename</div>
+                                    <div class="config-menu-item" data-action="delete">Delete</div>
+                                </div>
+                            </div>
+                        </template>
                     </div>
                     <div class="half-panel">
                         <div class="panel-header">actions</div>
@@ -2586,7 +3176,8 @@ body{{height:100vh;background:radial-gradient(circle at top,#0f0f0f,#050505);fon
 </div>
 
 <script>
-const key = "{license_key}";
+// The shell is identical for every license; the key comes from the URL
+const key = decodeURIComponent(location.pathname.slice(1));
 
 let config = {{
     "triggerbot": {{
@@ -2623,113 +3214,214 @@ let config = {{
     }}
 }};
 
-document.querySelectorAll('.tab').forEach(tab => {{
-    tab.addEventListener('click', () => {{
-        document.querySelectorAll('.tab').forEach(t => t.classList.remove('active'));
-        document.querySelectorAll('.tab-content').forEach(tc => tc.classList.remove('active'));
-        tab.classList.add('active');
-        document.getElementById(tab.getAttribute('data-tab')).classList.add('active');
-    }});
+// One delegated listener on the tab bar; swapping tracked refs beats
+// re-walking every .tab/.tab-content per click
+let activeTab = document.querySelector('.tab.active');
+let activeTabContent = document.querySelector('.tab-content.active');
+document.querySelector('.tabs').addEventListener('click', e => {{
+    const tab = e.target.closest('.tab');
+    if (!tab || tab === activeTab) return;
+    if (activeTab) activeTab.classList.remove('active');
+    if (activeTabContent) activeTabContent.classList.remove('active');
+    activeTab = tab;
+    activeTabContent = document.getElementById(tab.getAttribute('data-tab'));
+    activeTab.classList.add('active');
+    activeTabContent.classList.add('active');
 }});
 
+// Hand fetch pre-encoded UTF-8 bytes so it skips its internal re-encoding
+const ENC = new TextEncoder();
+
+// Only the latest full-document save matters; cancel any one it supersedes
+let saveAC = null;
+
+// djb2 over the serialized body; a repeat of the last-sent payload never
+// hits the wire
+let lastSaveHash = 0;
+function bodyHash(s) {{
+    let x = 5381;
+    for (let i = 0; i < s.length; i++) x = ((x << 5) + x) ^ s.charCodeAt(i);
+    return x;
+}}
+
 async function saveConfig() {{
+    const body = JSON.stringify(config);
+    const hv = bodyHash(body);
+    if (hv === lastSaveHash) return;
+    lastSaveHash = hv;
+    if (saveAC) saveAC.abort();
+    saveAC = new AbortController();
     try {{
         await fetch(`/api/config/${{key}}`, {{
             method: 'POST',
             headers: {{'Content-Type': 'application/json'}},
-            body: JSON.stringify(config)
+            keepalive: true,
+            signal: saveAC.signal,
+            body: ENC.encode(body)
         }});
     }} catch(e) {{
-        console.error('Save failed:', e);
+        if (e.name !== 'AbortError') {{
+            lastSaveHash = 0;  // failed sends must not block the retry
+            console.error('Save failed:', e);
+        }}
     }}
 }}
 
+// Buffer dirty fields and PATCH only what changed, batched into a 100ms window
+// with a guaranteed flush on release/unload
+const dirty = new Map();
+let saveTimer = 0;
+let draggingAnySlider = false;
+
+function markDirty(path, value) {{
+    dirty.set(path, value);
+    if (!saveTimer) saveTimer = setTimeout(flushSave, 100);
+}}
+
+function flushSave() {{
+    if (saveTimer) {{ clearTimeout(saveTimer); saveTimer = 0; }}
+    if (dirty.size === 0) return;
+    cfgStore.put('current', config).catch(() => {{}});
+    const payload = Object.fromEntries(dirty);
+    dirty.clear();
+    fetch(`/api/config/${{key}}`, {{
+        method: 'PATCH',
+        headers: {{'Content-Type': 'application/json'}},
+        keepalive: true,
+        body: ENC.encode(JSON.stringify(payload))
+    }}).catch(e => console.error('Save failed:', e));
+}}
+
+window.addEventListener('beforeunload', flushSave);
+// pagehide also covers back/forward-cache navigations that skip beforeunload
+window.addEventListener('pagehide', flushSave);
+// beforeunload is unreliable on mobile; hidden-tab flush catches those exits
+document.addEventListener('visibilitychange', () => {{
+    if (document.hidden) flushSave();
+}});
+
+// Minimal IndexedDB wrapper: last-known config is the synchronous source of
+// truth for hydration so first paint never waits on the network
+const cfgStore = {{
+    open() {{
+        return new Promise((resolve, reject) => {{
+            const req = indexedDB.open('camlock', 1);
+            req.onupgradeneeded = () => req.result.createObjectStore('cfg');
+            req.onsuccess = () => resolve(req.result);
+            req.onerror = () => reject(req.error);
+        }});
+    }},
+    async get(k) {{
+        const db = await this.open();
+        return new Promise((resolve, reject) => {{
+            const req = db.transaction('cfg').objectStore('cfg').get(k);
+            req.onsuccess = () => resolve(req.result);
+            req.onerror = () => reject(req.error);
+        }});
+    }},
+    async put(k, v) {{
+        const db = await this.open();
+        return new Promise((resolve, reject) => {{
+            const tx = db.transaction('cfg', 'readwrite');
+            tx.objectStore('cfg').put(v, k);
+            tx.oncomplete = () => resolve();
+            tx.onerror = () => reject(tx.error);
+        }});
+    }}
+}};
+
 async function loadConfig() {{
     try {{
         const res = await fetch(`/api/config/${{key}}`);
         config = await res.json();
         applyConfigToUI();
+        cfgStore.put('current', config).catch(() => {{}});
     }} catch(e) {{
         console.error('Load failed:', e);
     }}
 }}
 
+// DOM lookups and path splits done once at init; only configList changes later
+const TOGGLE_BINDINGS = [...document.querySelectorAll('.toggle[data-setting]')]
+    .map(el => ({{ el, setting: el.dataset.setting, path: el.dataset.setting.split('.') }}));
+const PICKER_BINDINGS = [...document.querySelectorAll('.keybind-picker[data-setting]')]
+    .map(el => ({{ el, setting: el.dataset.setting, path: el.dataset.setting.split('.') }}));
+const BODY_PART_ITEMS = [...document.querySelectorAll('#bodyPartList .dropdown-item')];
+const EASING_ITEMS = [...document.querySelectorAll('#easingList .dropdown-item')];
+
 function applyConfigToUI() {{
-    document.querySelectorAll('.toggle[data-setting]').forEach(toggle => {{
-        const setting = toggle.dataset.setting;
-        const [section, key] = setting.split('.');
+    TOGGLE_BINDINGS.forEach(({{ el, path }}) => {{
+        const [section, key] = path;
         if (config[section] && config[section][key] !== undefined) {{
-            toggle.classList.toggle('active', config[section][key]);
+            el.classList.toggle('active', config[section][key]);
         }}
     }});
 
-    document.querySelectorAll('.keybind-picker[data-setting]').forEach(picker => {{
-        const setting = picker.dataset.setting;
-        const [section, key] = setting.split('.');
+    PICKER_BINDINGS.forEach(({{ el, path }}) => {{
+        const [section, key] = path;
         if (config[section] && config[section][key] !== undefined) {{
-            picker.textContent = config[section][key];
+            el.textContent = config[section][key];
         }}
     }});
 
-    if (sliders.delay)       {{ sliders.delay.current = config.triggerbot.Delay;       sliders.delay.update(); }}
-    if (sliders.maxStuds)    {{ sliders.maxStuds.current = config.triggerbot.MaxStuds; sliders.maxStuds.update(); }}
-    if (sliders.pred)        {{ sliders.pred.current = config.triggerbot.Prediction;   sliders.pred.update(); }}
-    if (sliders.trigFov)     {{ sliders.trigFov.current = config.triggerbot.FOV;       sliders.trigFov.update(); }}
-    if (sliders.fov)         {{ sliders.fov.current = config.camlock.FOV;              sliders.fov.update(); }}
-    if (sliders.smoothX)     {{ sliders.smoothX.current = config.camlock.SmoothX;      sliders.smoothX.update(); }}
-    if (sliders.smoothY)     {{ sliders.smoothY.current = config.camlock.SmoothY;      sliders.smoothY.update(); }}
-    if (sliders.camlockPred) {{ sliders.camlockPred.current = config.camlock.Prediction; sliders.camlockPred.update(); }}
-    if (sliders.camlockMaxStuds) {{ sliders.camlockMaxStuds.current = config.camlock.MaxStuds; sliders.camlockMaxStuds.update(); }}
-    if (sliders.scale)       {{ sliders.scale.current = config.camlock.Scale;          sliders.scale.update(); }}
+    // Each slider carries its own [section, key] path, so no per-slider wiring
+    for (const s of Object.values(sliders)) {{
+        if (!s) continue;
+        const [sec, k] = s.path;
+        const v = config[sec] ? config[sec][k] : undefined;
+        if (v != null) {{
+            s.current = v;
+            s.update();
+        }}
+    }}
 
     if (config.camlock.BodyPart) {{
         document.getElementById('bodyPartHeader').textContent = config.camlock.BodyPart;
-        document.querySelectorAll('#bodyPartList .dropdown-item').forEach(item => {{
+        BODY_PART_ITEMS.forEach(item => {{
             item.classList.toggle('selected', item.dataset.value === config.camlock.BodyPart);
         }});
     }}
     if (config.camlock.EasingStyle) {{
         document.getElementById('easingHeader').textContent = config.camlock.EasingStyle;
-        document.querySelectorAll('#easingList .dropdown-item').forEach(item => {{
+        EASING_ITEMS.forEach(item => {{
             item.classList.toggle('selected', item.dataset.value === config.camlock.EasingStyle);
         }});
     }}
 }}
 
-document.querySelectorAll('.toggle[data-setting]').forEach(toggle => {{
-    toggle.addEventListener('click', () => {{
-        toggle.classList.toggle('active');
-        const setting = toggle.dataset.setting;
-        const [section, key] = setting.split('.');
-        config[section][key] = toggle.classList.contains('active');
-        saveConfig();
+TOGGLE_BINDINGS.forEach(({{ el, setting, path }}) => {{
+    el.addEventListener('click', () => {{
+        el.classList.toggle('active');
+        const [section, key] = path;
+        config[section][key] = el.classList.contains('active');
+        markDirty(setting, config[section][key]);
     }});
 }});
 
-document.querySelectorAll('.keybind-picker[data-setting]').forEach(picker => {{
+const MOUSE_BUTTON_NAMES = ['Left Mouse', 'Middle Mouse', 'Right Mouse'];
+
+PICKER_BINDINGS.forEach(({{ el: picker, setting, path }}) => {{
     picker.addEventListener('click', () => {{
         picker.textContent = '...';
         const listener = (e) => {{
             e.preventDefault();
             let keyName = '';
-            if (e.button !== undefined) {{
-                keyName = e.button === 0 ? 'Left Mouse' :
-                          e.button === 2 ? 'Right Mouse' :
-                          e.button === 1 ? 'Middle Mouse' : `Mouse${{e.button}}`;
+            if (e instanceof MouseEvent) {{
+                keyName = MOUSE_BUTTON_NAMES[e.button] || ('Mouse' + e.button);
             }} else if (e.key) {{
                 keyName = e.key.toUpperCase();
                 if (keyName === ' ') keyName = 'SPACE';
             }}
             picker.textContent = keyName || 'NONE';
-            const setting = picker.dataset.setting;
-            const [section, key] = setting.split('.');
+            const [section, key] = path;
             config[section][key] = keyName;
-            saveConfig();
+            markDirty(setting, keyName);
             document.removeEventListener('keydown', listener);
-            document.removeEventListener('mousedown', listener);
+            document.removeEventListener('mousedown', listener, true);
         }};
         document.addEventListener('keydown', listener, {{once: true}});
-        document.addEventListener('mousedown', listener, {{once: true}});
+        // Capture phase so inner handlers can't swallow the pick
+        document.addEventListener('mousedown', listener, {{once: true, capture: true}});
     }});
 }});
 
@@ -2737,32 +3429,32 @@ document.getElementById('bodyPartHeader').addEventListener('click', () => {{
     document.getElementById('bodyPartList').classList.toggle('open');
 }});
 
-document.querySelectorAll('#bodyPartList .dropdown-item').forEach(item => {{
-    item.addEventListener('click', () => {{
-        const value = item.dataset.value;
-        document.getElementById('bodyPartHeader').textContent = value;
-        document.querySelectorAll('#bodyPartList .dropdown-item').forEach(i => i.classList.remove('selected'));
-        item.classList.add('selected');
-        document.getElementById('bodyPartList').classList.remove('open');
-        config.camlock.BodyPart = value;
-        saveConfig();
-    }});
+document.getElementById('bodyPartList').addEventListener('click', (e) => {{
+    const item = e.target.closest('.dropdown-item');
+    if (!item) return;
+    const value = item.dataset.value;
+    document.getElementById('bodyPartHeader').textContent = value;
+    document.querySelectorAll('#bodyPartList .dropdown-item').forEach(i => i.classList.remove('selected'));
+    item.classList.add('selected');
+    document.getElementById('bodyPartList').classList.remove('open');
+    config.camlock.BodyPart = value;
+    markDirty('camlock.BodyPart', value);
 }});
 
 document.getElementById('easingHeader').addEventListener('click', () => {{
     document.getElementById('easingList').classList.toggle('open');
 }});
 
-document.querySelectorAll('#easingList .dropdown-item').forEach(item => {{
-    item.addEventListener('click', () => {{
-        const value = item.dataset.value;
-        document.getElementById('easingHeader').textContent = value;
-        document.querySelectorAll('#easingList .dropdown-item').forEach(i => i.classList.remove('selected'));
-        item.classList.add('selected');
-        document.getElementById('easingList').classList.remove('open');
-        config.camlock.EasingStyle = value;
-        saveConfig();
-    }});
+document.getElementById('easingList').addEventListener('click', (e) => {{
+    const item = e.target.closest('.dropdown-item');
+    if (!item) return;
+    const value = item.dataset.value;
+    document.getElementById('easingHeader').textContent = value;
+    document.querySelectorAll('#easingList .dropdown-item').forEach(i => i.classList.remove('selected'));
+    item.classList.add('selected');
+    document.getElementById('easingList').classList.remove('open');
+    config.camlock.EasingStyle = value;
+    markDirty('camlock.EasingStyle', value);
 }});
 
 const sliders = {{}};
@@ -2779,18 +3471,22 @@ function createDecimalSlider(id, fillId, valueId, defaultVal, min, max, step, se
         max: max,
         step: step,
         setting: setting,
+        path: setting.split('.'),
         threshold: textColorThreshold,
         update: function() {{
-            const percent = ((this.current - this.min) / (this.max - this.min)) * 100;
-            fill.style.width = percent + '%';
+            // scaleX stays on the compositor; width would force re-layout
+            const pct = (this.current - this.min) / (this.max - this.min);
+            fill.style.transform = 'scaleX(' + pct + ')';
             valueText.textContent = this.current.toFixed(2);
             valueText.style.color = this.current < this.threshold ? '#fff' : '#000';
         }}
     }};
 
     slider.addEventListener('mousedown', (e) => {{
+        draggingAnySlider = true;
         const rect = slider.getBoundingClientRect();
-        function move(e) {{
+        let pendingEv = null, rafId = 0;
+        function apply(e) {{
             const x = e.clientX - rect.left;
             let percent = Math.max(0, Math.min(100, (x / rect.width) * 100));
             obj.current = obj.min + (percent / 100) * (obj.max - obj.min);
@@ -2799,15 +3495,29 @@ function createDecimalSlider(id, fillId, valueId, defaultVal, min, max, step, se
             obj.update();
             const [section, key] = obj.setting.split('.');
             config[section][key] = obj.current;
-            saveConfig();
+            markDirty(obj.setting, obj.current);
+        }}
+        function move(e) {{
+            // Coalesce to one update per animation frame
+            pendingEv = e;
+            if (!rafId) rafId = requestAnimationFrame(() => {{
+                rafId = 0;
+                const ev = pendingEv;
+                pendingEv = null;
+                apply(ev);
+            }});
         }}
         function up() {{
+            if (rafId) {{ cancelAnimationFrame(rafId); rafId = 0; }}
+            if (pendingEv) {{ const ev = pendingEv; pendingEv = null; apply(ev); }}
             document.removeEventListener('mousemove', move);
             document.removeEventListener('mouseup', up);
+            flushSave();
+            draggingAnySlider = false;
         }}
         document.addEventListener('mousemove', move);
         document.addEventListener('mouseup', up);
-        move(e);
+        apply(e);
     }});
 
     obj.update();
@@ -2824,31 +3534,48 @@ function createIntSlider(id, fillId, valueId, defaultVal, max, blackThreshold, s
         max: max,
         blackThreshold: blackThreshold,
         setting: setting,
+        path: setting.split('.'),
         update: function() {{
-            const percent = (this.current / this.max) * 100;
-            fill.style.width = percent + '%';
+            // scaleX stays on the compositor; width would force re-layout
+            fill.style.transform = 'scaleX(' + (this.current / this.max) + ')';
             valueText.textContent = Math.round(this.current);
             valueText.style.color = this.current >= this.blackThreshold ? '#000' : '#fff';
         }}
     }};
     slider.addEventListener('mousedown', (e) => {{
+        draggingAnySlider = true;
         const rect = slider.getBoundingClientRect();
-        function move(e) {{
+        let pendingEv = null, rafId = 0;
+        function apply(e) {{
             const x = e.clientX - rect.left;
             const percent = Math.max(0, Math.min(100, (x / rect.width) * 100));
             obj.current = (percent / 100) * obj.max;
             obj.update();
             const [section, key] = obj.setting.split('.');
             config[section][key] = Math.round(obj.current);
-            saveConfig();
+            markDirty(obj.setting, config[section][key]);
+        }}
+        function move(e) {{
+            // Coalesce to one update per animation frame
+            pendingEv = e;
+            if (!rafId) rafId = requestAnimationFrame(() => {{
+                rafId = 0;
+                const ev = pendingEv;
+                pendingEv = null;
+                apply(ev);
+            }});
         }}
         function up() {{
+            if (rafId) {{ cancelAnimationFrame(rafId); rafId = 0; }}
+            if (pendingEv) {{ const ev = pendingEv; pendingEv = null; apply(ev); }}
             document.removeEventListener('mousemove', move);
             document.removeEventListener('mouseup', up);
+            flushSave();
+            draggingAnySlider = false;
         }}
         document.addEventListener('mousemove', move);
         document.addEventListener('mouseup', up);
-        move(e);
+        apply(e);
     }});
     obj.update();
     return obj;
@@ -2865,39 +3592,62 @@ sliders.camlockPred     = createDecimalSlider('camlockPredSlider', 'camlockPredF
 sliders.camlockMaxStuds = createIntSlider(   'camlockMaxStudsSlider', 'camlockMaxStudsFill', 'camlockMaxStudsValue', 120, 300, 150, 'camlock.MaxStuds');
 sliders.scale = createDecimalSlider('scaleSlider', 'scaleFill', 'scaleValue', 1.0, 0.5, 2.0, 0.1, 'camlock.Scale', 1.20);
 
+// Reconcile rows against a keyed map instead of reparsing HTML every refresh
+const cfgRowTpl = document.getElementById('cfgRowTpl').content;
+const configRows = new Map();
+
 async function loadSavedConfigs() {{
     try {{
         const res = await fetch(`/api/configs/${{key}}/list`);
         const data = await res.json();
         const list = document.getElementById('configList');
-        list.innerHTML = '';
-        data.configs.forEach((cfg, idx) => {{
-            const div = document.createElement('div');
-            div.className = 'config-item';
-            div.innerHTML = `
-                <div class="config-name">${{cfg.name}}</div>
-                <div class="config-dots" onclick="toggleConfigMenu(event, ${{idx}})">⋮</div>
-                <div class="config-menu" id="configMenu${{idx}}">
-                    <div class="config-menu-item" onclick="loadConfigByName('${{cfg.name}}')">Load</div>
-                    <div class="config-menu-item" onclick="renameConfigPrompt('${{cfg.name}}')">Rename</div>
-                    <div class="config-menu-item" onclick="deleteConfigByName('${{cfg.name}}')">Delete</div>
-                </div>
-            `;
-            list.appendChild(div);
+        const seen = new Set();
+
+        data.configs.forEach((cfg) => {{
+            seen.add(cfg.name);
+            let row = configRows.get(cfg.name);
+            if (!row) {{
+                row = cfgRowTpl.cloneNode(true).firstElementChild;
+                row.dataset.name = cfg.name;
+                row.querySelector('.config-name').textContent = cfg.name;
+                configRows.set(cfg.name, row);
+            }}
+            // appendChild moves already-attached rows into the right order
+            list.appendChild(row);
         }});
+
+        for (const [name, row] of configRows) {{
+            if (!seen.has(name)) {{
+                row.remove();
+                configRows.delete(name);
+            }}
+        }}
     }} catch(e) {{
         console.error(e);
     }}
 }}
 
-function toggleConfigMenu(e, idx) {{
-    e.stopPropagation();
-    const menu = document.getElementById(`configMenu${{idx}}`);
-    document.querySelectorAll('.config-menu').forEach(m => {{
-        if (m !== menu) m.classList.remove('open');
-    }});
-    menu.classList.toggle('open');
-}}
+// One delegated listener for the whole config list instead of per-item handlers
+document.getElementById('configList').addEventListener('click', (e) => {{
+    const el = e.target.closest('[data-action]');
+    if (!el) return;
+    const item = el.closest('.config-item');
+    const name = item.dataset.name;
+    switch (el.dataset.action) {{
+        case 'menu': {{
+            e.stopPropagation();
+            const menu = item.querySelector('.config-menu');
+            document.querySelectorAll('.config-menu').forEach(m => {{
+                if (m !== menu) m.classList.remove('open');
+            }});
+            menu.classList.toggle('open');
+            break;
+        }}
+        case 'load': loadConfigByName(name); break;
+        case 'rename': renameConfigPrompt(name); break;
+        case 'delete': deleteConfigByName(name); break;
+    }}
+}});
 
 document.addEventListener('click', () => {{
     document.querySelectorAll('.config-menu').forEach(m => m.classList.remove('open'));
@@ -2980,14 +3730,86 @@ async function deleteConfigByName(name) {{
 }}
 
 loadSavedConfigs();
-loadConfig();
-setInterval(loadConfig, 1000);
+
+// Hydrate the UI from the local cache first, then reconcile with the server
+(async () => {{
+    try {{
+        const cached = await cfgStore.get('current');
+        if (cached) {{
+            config = cached;
+            applyConfigToUI();
+        }}
+    }} catch(e) {{}}
+    loadConfig();
+}})();
+
+// Server pushes config changes; hidden tabs hold no stream open at all
+let configStream = null;
+
+function startConfigStream() {{
+    if (configStream) return;
+    configStream = new EventSource(`/api/config/${{key}}/stream`);
+    configStream.onmessage = (e) => {{
+        if (draggingAnySlider) return;
+        config = JSON.parse(e.data);
+        applyConfigToUI();
+    }};
+}}
+
+function stopConfigStream() {{
+    if (!configStream) return;
+    configStream.close();
+    configStream = null;
+}}
+
+document.addEventListener('visibilitychange', () => {{
+    if (document.hidden) {{
+        stopConfigStream();
+    }} else {{
+        loadConfig();
+        startConfigStream();
+    }}
+}});
+
+if (!document.hidden) startConfigStream();
 </script>
 
 {ENHANCED_ANTI_DEVTOOLS_JS}
 </body>
 </html>"""
 
+# The shell carries no per-key content, so one pre-encoded blob serves everyone
+_USER_DASHBOARD_BYTES = _USER_DASHBOARD_HTML.encode("utf-8")
+_USER_DASHBOARD_GZ = gzip.compress(_USER_DASHBOARD_BYTES, 9)
+_USER_DASHBOARD_ETAG = f'"{hashlib.sha1(_USER_DASHBOARD_BYTES).hexdigest()}"'
+del _USER_DASHBOARD_HTML
+
+# Reject bot/browser noise before it costs a DB round-trip; anything with a
+# dot is a file probe, never a license key
+_RESERVED_PATHS = frozenset({"api", "favicon.ico", "home", "robots.txt", "sitemap.xml"})
+
+@app.get("/{license_key}", response_class=HTMLResponse)
+def serve_dashboard(license_key: str, request: Request):
+    """Personal dashboard"""
+    if license_key in _RESERVED_PATHS or "." in license_key:
+        return Response(status_code=404, headers={"Cache-Control": "public, max-age=86400"})
+
+    if request.headers.get("if-none-match") == _USER_DASHBOARD_ETAG:
+        return Response(status_code=304)
+
+    db = get_db()
+    cur = db.cursor()
+
+    # Existence probe only; no reason to drag the whole row over the wire
+    cur.execute(q("SELECT 1 FROM keys WHERE key=%s LIMIT 1"), (license_key,))
+    result = cur.fetchone()
+    db.close()
+
+    if not result:
+        return Response(content=_INVALID_LICENSE_HTML_BYTES, media_type="text/html; charset=utf-8")
+
+    return _static_page(request, _USER_DASHBOARD_BYTES, _USER_DASHBOARD_GZ, _USER_DASHBOARD_ETAG)
+
 if __name__ == "__main__":
     init_db()
     import uvicorn